@@ -1,5 +1,8 @@
 import logging
 import os
+import csv
+import importlib.util
+import concurrent.futures
 
 import vtk
 import pathlib
@@ -15,18 +18,13 @@ import logging
 #from qt import QtCore, QtGui
 
 
-try:
-    import pandas as pd
-    import numpy as np
-    import SimpleITK as sitk
-except:
-    slicer.util.pip_install('pandas')
-    slicer.util.pip_install('numpy')
-    slicer.util.pip_install('SimpleITK')
-    
-    import pandas as pd
-    import numpy as np
-    import SimpleITK as sitk
+# module name -> pip package, imported where used so that they are not loaded on every Slicer startup
+DEPENDENCIES = {'pandas': 'pandas', 'numpy': 'numpy', 'SimpleITK': 'SimpleITK', 'nibabel': 'nibabel'}
+
+def install_missing_dependencies():
+    for module_name, package in DEPENDENCIES.items():
+        if importlib.util.find_spec(module_name) is None:
+            slicer.util.pip_install(package)
 #
 # SegmentationReview
 #
@@ -34,6 +32,11 @@ except:
 import warnings
 warnings.filterwarnings("ignore")
 
+# columns of annotations.csv, the file is written without a header
+ANNOTATION_COLUMNS = ["file","annotation","comment","mask_path","mask_status"]
+NIFTI_EXTENSIONS = (".nii", ".nii.gz")
+VALID_EXTENSIONS = NIFTI_EXTENSIONS + (".nrrd",)
+
 class SegmentationReview(ScriptedLoadableModule):
     """Uses ScriptedLoadableModule base class, available at:
     https://github.com/Slicer/Slicer/blob/master/Base/Python/slicer/ScriptedLoadableModule.py
@@ -91,6 +94,10 @@ class SegmentationReviewWidget(ScriptedLoadableModuleWidget, VTKObservationMixin
         self.pointListNode = None
         self.window_level = None   # To store current window/level settings
         self.segment_visiblity_states = {}  # Dictionary to store the visibility toggle of each segment
+        # one background reader, so that at most one case is decompressed at a time
+        self._prefetch_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._prefetch_job = None  # (index, (image path, mask path), Future) of the case being read ahead of time
+        self._prefetch_index = None  # latest index requested, older jobs skip their read
 
 
 
@@ -100,6 +107,7 @@ class SegmentationReviewWidget(ScriptedLoadableModuleWidget, VTKObservationMixin
         """
         import qSlicerSegmentationsModuleWidgetsPythonQt
         ScriptedLoadableModuleWidget.setup(self)
+        install_missing_dependencies()
 
         # Load widget from .ui file (created by Qt Designer).
         # Additional widgets can be instantiated manually and added to self.layout.
@@ -149,8 +157,6 @@ class SegmentationReviewWidget(ScriptedLoadableModuleWidget, VTKObservationMixin
         self.addObserver(slicer.mrmlScene, slicer.mrmlScene.StartCloseEvent, self.onSceneStartClose)
         self.addObserver(slicer.mrmlScene, slicer.mrmlScene.EndCloseEvent, self.onSceneEndClose)
         
-        self.ui.PathLineEdit = ctk.ctkDirectoryButton()
-        
         # These connections ensure that whenever user changes some settings on the GUI, that is saved in the MRML scene
         # (in the selected parameter node).
         self.atlasDirectoryButton.directoryChanged.connect(self.onAtlasDirectoryChanged)
@@ -235,6 +241,7 @@ class SegmentationReviewWidget(ScriptedLoadableModuleWidget, VTKObservationMixin
         self.segmentation_files[self.current_index] = self.file_path_nifti
         # Save the segmentation node to file
         slicer.util.saveNode(self.segmentation_node, file_path)
+        import SimpleITK as sitk
         img = sitk.ReadImage(file_path)
         
         sitk.WriteImage(img, self.file_path_nifti)
@@ -249,7 +256,7 @@ class SegmentationReviewWidget(ScriptedLoadableModuleWidget, VTKObservationMixin
         return os.path.join(os.sep, rootdir+os.sep,targetdir)
 
     def _is_valid_extension(self, path):
-        return any(path.endswith(i) for i in [".nii", ".nii.gz", ".nrrd"])
+        return path.endswith(VALID_EXTENSIONS)
     
     def _construct_full_path(self, path):
         if os.path.isabs(path):
@@ -257,25 +264,17 @@ class SegmentationReviewWidget(ScriptedLoadableModuleWidget, VTKObservationMixin
         else:
             return self.joinpath(self.directory, path)
     
-    def _restore_index(self, ann_csv, files_list, mask_list, mask_status_list=None):
-        #print(files_list,mask_list)
+    def _restore_index(self, ann_csv):
         #print(self.unique_case_flag)
         #ann_csv {[self.nifti_files[self.current_index]],[likert_score],[self.ui.comment.toPlainText()]}
+        # Only needed for mapping_unique.csv, in the other cases checked files are skipped while scanning the directory
         statuses, unchecked_files, unchecked_masks, checked_ids, id_subs_list = [], [], [], [], []
-        list_of_checked = ann_csv['file'].values
-        list_of_checked = [self._construct_full_path(i) for i in list_of_checked]
-        
-        list_of_checked_masks = ann_csv['mask_path'].values
-        #print(list_of_checked)
-        # check if ['mask_path'] is empty
-        if type(list_of_checked_masks[0]) == str:
-            list_of_checked_masks = [self._construct_full_path(i) for i in list_of_checked_masks]
         
         #find subset of files that are not checked
         if self.unique_case_flag:
             # read what ids were checked by finding the corresponding ids
             checked_ids = []
-            list_of_checked = ann_csv['file'].values
+            list_of_checked = set(ann_csv['file'])
             # first, check what ids were checked
             for id_subj, img, _ in zip(self.mappings["subj_id"], self.mappings["img_path"], self.mappings["mask_path"]):
                 if img in list_of_checked:
@@ -296,18 +295,29 @@ class SegmentationReviewWidget(ScriptedLoadableModuleWidget, VTKObservationMixin
             #print("Checked ids",checked_ids)
             #print("Unchecked files",unchecked_files)
             #print("Unchecked masks",unchecked_masks)
-            
-        else:
-            for i in range(len(files_list)):
-                if files_list[i] not in list_of_checked:
-                    unchecked_files.append(files_list[i])
-                    unchecked_masks.append(mask_list[i])
-                    statuses.append(mask_status_list[i])
         
         
         #return list of unchecked files
         return unchecked_files, unchecked_masks, statuses, id_subs_list, checked_ids
     
+    def _read_annotations(self, path, columns=ANNOTATION_COLUMNS):
+        """Read annotations.csv (no header) into a dict of columns, keeping only the requested ones."""
+        indices = [(name, ANNOTATION_COLUMNS.index(name)) for name in columns]
+        result = {name: [] for name in columns}
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.reader(f):
+                if not row:
+                    continue
+                for name, i in indices:
+                    result[name].append(row[i] if i < len(row) else "")
+        return result
+
+    def _append_annotation(self, row):
+        """Append one row to annotations.csv, written the same way DataFrame.to_csv did (utf-8, os.linesep)."""
+        # reopened on every save, so that moving or deleting the file during a session does not lose ratings
+        with open(self.joinpath(self.directory,"annotations.csv"), 'a', newline='', encoding='utf-8') as f:
+            csv.writer(f, lineterminator=os.linesep).writerow(row)
+
     def getDefaultSourceVolumeNodeID(self):
         layoutManager = slicer.app.layoutManager()
         firstForegroundVolumeID = None
@@ -356,11 +366,13 @@ class SegmentationReviewWidget(ScriptedLoadableModuleWidget, VTKObservationMixin
         fileHandler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s: %(message)s'))
         logger.addHandler(fileHandler) 
         
-        try:
-            slicer.mrmlScene.RemoveNode(self.volume_node) 
-            slicer.mrmlScene.RemoveNode(self.segmentation_node)
-        except:
-            pass
+        # load the .cvs file with the old annotations first, so that checked files are skipped while scanning
+        ann_csv = None
+        checked_files = set()
+        if os.path.exists(self.joinpath(directory,"annotations.csv")):
+            # only the file names are needed to restore the session
+            ann_csv = self._read_annotations(self.joinpath(directory,"annotations.csv"), columns=["file"])
+            checked_files = {self._construct_full_path(i) for i in ann_csv['file']}
         
         self.unique_case_flag=False
         # case 0: searching for one unique nifti file for id
@@ -369,6 +381,7 @@ class SegmentationReviewWidget(ScriptedLoadableModuleWidget, VTKObservationMixin
             case_flag = True
             # mapping file contains id and nifti file name
             id_subs = []
+            import pandas as pd
             self.mappings = pd.read_csv(self.joinpath(directory,"mapping_unique.csv"))
             self.unique_case_flag = True
             for id_subj, img, mask in zip(self.mappings["subj_id"], self.mappings["img_path"], self.mappings["mask_path"]):
@@ -409,12 +422,15 @@ class SegmentationReviewWidget(ScriptedLoadableModuleWidget, VTKObservationMixin
         elif os.path.exists(self.joinpath(directory,"mapping.csv")):
             logger.info('Found mappings between files and masks') 
             #print("Found mappings between files and masks")
+            import pandas as pd
             self.mappings = pd.read_csv(self.joinpath(directory,"mapping.csv"))
             self.with_mapper_flag = True
             # casting to zero all nan values
             
             #print("Loaded mappings between files and masks")
             for img, mask in zip(self.mappings["img_path"], self.mappings["mask_path"]):
+                if self.joinpath(directory,img) in checked_files:
+                    continue
                 # counting images
                 if os.path.exists(self.joinpath(directory,img)) and self._is_valid_extension(self.joinpath(directory,img)):
                     self.nifti_files.append(self.joinpath(directory,img))
@@ -446,12 +462,18 @@ class SegmentationReviewWidget(ScriptedLoadableModuleWidget, VTKObservationMixin
         else:
             logger.info('No mappings between files and masks') 
             #print("No mappings between files and masks")
-            for file in os.listdir(directory):
-                if ".nii" in file and "_mask" not in file:  
+            # list the folder once, mask lookups are then done on the names instead of a stat per file
+            with os.scandir(directory) as entries:
+                file_names = [entry.name for entry in entries if entry.is_file()]
+            existing_files = set(file_names)
+            for file in file_names:
+                # non-volume files are rejected by the extension check before anything else runs
+                if file.endswith(NIFTI_EXTENSIONS) and "_mask" not in file and self.joinpath(directory,file) not in checked_files:  
                     self.nifti_files.append(self.joinpath(directory,file)) #
                     
-                    if os.path.exists(self.joinpath(directory,file.split(".")[0]+"_mask.nii.gz")):
-                        self.segmentation_files.append(self.joinpath(directory,file.split(".")[0]+"_mask.nii.gz"))
+                    mask_file = file.split(".")[0]+"_mask.nii.gz"
+                    if mask_file in existing_files:
+                        self.segmentation_files.append(self.joinpath(directory,mask_file))
                         self.seg_mask_status.append(2) # 0 - no mask, 1 - mask path, cannot load , 2 - mask loaded
                         logger.info(f'Found mask for {file}')
                     else:
@@ -462,22 +484,15 @@ class SegmentationReviewWidget(ScriptedLoadableModuleWidget, VTKObservationMixin
                 #    logger.info(f'File {file} does not exist or has wrong extension, skipping')
                         
         self.current_index = 0               
-        # load the .cvs file with the old annotations or create a new one
-        #print("Path exists",os.path.exists(self.joinpath(directory,"annotations.csv")))
-        if os.path.exists(self.joinpath(directory,"annotations.csv")):
-        
-            ann_csv = pd.read_csv(self.joinpath(directory,"annotations.csv"), header=None,index_col=False, names=["file","annotation","comment","mask_path","mask_status"])
+        if ann_csv is not None:
             #print(ann_csv)
             if self.unique_case_flag:
-                self.nifti_files, self.segmentation_files, self.seg_mask_status, self.id_subs, self.id_subs_checked = self._restore_index(ann_csv, self.nifti_files,
-                                                                                                 self.segmentation_files, self.seg_mask_status)
-            else:
-                self.nifti_files, self.segmentation_files, self.seg_mask_status, _,_ = self._restore_index(ann_csv, self.nifti_files, self.segmentation_files, self.seg_mask_status)
+                self.nifti_files, self.segmentation_files, self.seg_mask_status, self.id_subs, self.id_subs_checked = self._restore_index(ann_csv)
             
             logger.info(f'Found session, restoring annotations {len(self.nifti_files)} files left') 
             
         self.n_files = len(self.nifti_files)
-        self.ui.status_checked.setText("Checked: "+ str(self.current_index) + " / "+str(self.n_files))
+        self.update_status_checked()
         
         #print("Images:",len(self.nifti_files), 
         #      "Masks:",len(self.segmentation_files))
@@ -519,26 +534,22 @@ class SegmentationReviewWidget(ScriptedLoadableModuleWidget, VTKObservationMixin
         # append data frame to CSV file
         if  self.finish_flag == False:
             head, tail = os.path.split(self.nifti_files[self.current_index])
-            data = {'file': [self.nifti_files[self.current_index].replace(head,"").replace("/","").replace("\\","")],
-                        'annotation': [self._rating_to_str(likert_score)],
-                        'comment': [self.ui.comment.toPlainText()],
-                        'mask_path': [self.segmentation_files[self.current_index].replace(head,"").replace("/","").replace("\\","")],
-                        'mask_status': [self._numerical_status_to_str(self.seg_mask_status[self.current_index])]}
-            df = pd.DataFrame(data)   
-            df.to_csv(self.joinpath(self.directory,"annotations.csv"), mode='a', index=False, header=False)
+            self._append_annotation([self.nifti_files[self.current_index].replace(head,"").replace("/","").replace("\\",""),
+                                     self._rating_to_str(likert_score),
+                                     self.ui.comment.toPlainText(),
+                                     self.segmentation_files[self.current_index].replace(head,"").replace("/","").replace("\\",""),
+                                     self._numerical_status_to_str(self.seg_mask_status[self.current_index])])
 
         # go to the next file if there is one
         ret = 0
         if self.current_index <= self.n_files:#-1:
+            # the nodes themselves are removed by load_nifti_file
             if self.volume_node:
                 # Store current window and level
                 self.store_current_window_level_settings()
-                slicer.mrmlScene.RemoveNode(self.volume_node)
             if self.segmentation_node:
                 # Store current mask label visibility states
                 self.store_segment_visiblity_states()
-                slicer.mrmlScene.RemoveNode(self.segmentation_node)
-                slicer.mrmlScene.RemoveNode(self.pointListNode)
                 #slicer.mrmlScene.Clear(0)
             if self.unique_case_flag:
                 while ret == 0 and self.current_index <= self.n_files:#-1:
@@ -560,12 +571,16 @@ class SegmentationReviewWidget(ScriptedLoadableModuleWidget, VTKObservationMixin
                 self.load_nifti_file()
 
             self.ui.comment.setPlainText("")
-            self.ui.status_checked.setText("Checked: "+ str(self.current_index) + " / "+str(self.n_files))
+            self.update_status_checked()
 
         else:
             #print("_All files checked")
             self.finish_flag = True
 
+    def update_status_checked(self):
+        """Show the review progress as "Checked: <current index> / <number of files>"."""
+        self.ui.status_checked.setText(f"Checked: {self.current_index} / {self.n_files}")
+
     def store_current_window_level_settings(self):
         """Store current HU window and level settings."""
         self.window_level = (self.volume_node.GetDisplayNode().GetWindow(), self.volume_node.GetDisplayNode().GetLevel())
@@ -580,22 +595,33 @@ class SegmentationReviewWidget(ScriptedLoadableModuleWidget, VTKObservationMixin
 
     def store_segment_visiblity_states(self):
         """Store the visibility states of mask labels."""
+        display_node = self.segmentation_node.GetDisplayNode()
         for segment_id in self.segmentation_node.GetSegmentation().GetSegmentIDs():
-            visibility = self.segmentation_node.GetDisplayNode().GetSegmentVisibility(segment_id)
-            self.segment_visiblity_states[segment_id] = visibility
+            self.segment_visiblity_states[segment_id] = display_node.GetSegmentVisibility(segment_id)
 
     def restore_segment_visiblity_states(self):
         """Restore the visibility states of mask labels.""" 
+        display_node = self.segmentation_node.GetDisplayNode()
+        # Batch the changes so that the views are updated once instead of once per segment
+        wasModified = display_node.StartModify()
         for segment_id in self.segmentation_node.GetSegmentation().GetSegmentIDs():
-            visibility = self.segment_visiblity_states.get(segment_id, True)
-            self.segmentation_node.GetDisplayNode().SetSegmentVisibility(segment_id, visibility)
+            display_node.SetSegmentVisibility(segment_id, self.segment_visiblity_states.get(segment_id, True))
+        display_node.EndModify(wasModified)
 
 
+    def _drop_active_nodes(self):
+        """Remove the nodes of the current case from the scene, each of them only once."""
+        for node in {self.volume_node, self.segmentation_node, self.pointListNode, self.segmentEditorWidget.segmentationNode()}:
+            # the scene clears a node's scene pointer when the node is removed, this avoids the linear IsNodePresent scan
+            if node and node.GetScene() is slicer.mrmlScene:
+                slicer.mrmlScene.RemoveNode(node)
+        self.volume_node = None
+        self.segmentation_node = None
+        self.pointListNode = None
+
     def load_nifti_file(self, unique=False):
         """Load NIFTI file and associated segmentation."""
-        for node in [self.volume_node, self.segmentation_node, self.pointListNode, self.segmentEditorWidget.segmentationNode()]:
-            if node:
-                slicer.mrmlScene.RemoveNode(node)
+        self._drop_active_nodes()
         slicer.util.resetSliceViews()
         
         if unique:
@@ -607,12 +633,23 @@ class SegmentationReviewWidget(ScriptedLoadableModuleWidget, VTKObservationMixin
         # Pause rendering until all data is loaded
         slicer.app.layoutManager().setRenderPaused(True)
 
-        self.volume_node = slicer.util.loadVolume(self.nifti_files[self.current_index])
+        image_file = self.nifti_files[self.current_index]
+        segmentation_file = self.segmentation_files[self.current_index]
+        image_arrays, segmentation_arrays = self._take_prefetched(self.current_index, (image_file, segmentation_file))
+
+        self.volume_node = self._load_nii_as_volume(image_file, image_arrays)
         # Adjust window/level based on the previous settings, if any.
         self.restore_window_level_settings()
         
         try:
-            self.segmentation_node = slicer.util.loadSegmentation(self.segmentation_files[self.current_index])
+            self.segmentation_node = self._load_nii_as_segmentation(segmentation_file, segmentation_arrays)
+            # Make the binary labelmap the source representation on the volume geometry now,
+            # so that the first paint/erase stroke does not have to convert or resample it.
+            binary_labelmap = slicer.vtkSegmentationConverter.GetBinaryLabelmapRepresentationName()
+            segmentation = self.segmentation_node.GetSegmentation()
+            segmentation.SetSourceRepresentationName(binary_labelmap)
+            segmentation.CreateRepresentation(binary_labelmap, True)
+            self.segmentation_node.SetReferenceImageGeometryParameterFromVolumeNode(self.volume_node)
             # Restore the segment visibility toggles from the previous segmentation, if any.
             self.restore_segment_visiblity_states()
             # Set the segmentation node to the segment editor widget
@@ -623,15 +660,117 @@ class SegmentationReviewWidget(ScriptedLoadableModuleWidget, VTKObservationMixin
 
         # Resume rendering to show the loaded data
         slicer.app.layoutManager().setRenderPaused(False)
+
+        # Read the next case from disk while the current one is being reviewed
+        self._prefetch(self.current_index + 1)
         
         return None
 
+    def _prefetch(self, index):
+        """Read the image and mask at index on the background reader and keep the Future in self._prefetch_job.
+        Only the file reading and decompression is done there, MRML nodes are created on the main thread."""
+        if self._prefetch_job is not None:
+            self._prefetch_job[2].cancel()
+            self._prefetch_job = None
+        if index >= len(self.nifti_files):
+            return
+        paths = (self.nifti_files[index], self.segmentation_files[index])
+        self._prefetch_index = index
+
+        def worker():
+            # a newer case was requested before this one started, do not decompress it for nothing
+            if self._prefetch_index != index:
+                return None
+            image_file, segmentation_file = paths
+            try:
+                image_arrays = self._read_nifti(image_file)
+            except Exception:
+                return None
+            try:
+                segmentation_arrays = self._read_nifti(segmentation_file) if segmentation_file else None
+            except Exception:
+                segmentation_arrays = None
+            return image_arrays, segmentation_arrays
+
+        self._prefetch_job = (index, paths, self._prefetch_executor.submit(worker))
+
+    def _take_prefetched(self, index, paths):
+        """Return the (image arrays, mask arrays) read ahead for index, waiting for the read if it is still running.
+        Returns (None, None) if nothing usable was prefetched for these paths."""
+        job, self._prefetch_job = self._prefetch_job, None
+        if job is None:
+            return None, None
+        job_index, job_paths, future = job
+        if job_index != index or job_paths != paths:
+            future.cancel()
+            return None, None
+        try:
+            result = future.result()
+        except Exception:
+            result = None
+        return result if result is not None else (None, None)
+
+    def _read_nifti(self, path):
+        """Read a 3D NIfTI file with nibabel, returns the voxel array in Slicer (KJI) order and the IJK to RAS affine."""
+        import nibabel as nib
+        import numpy as np
+        img = nib.load(str(path))
+        arr = np.asarray(img.dataobj)
+        # unscaled data keeps the on-disk byte order, VTK expects native order
+        arr = arr.astype(arr.dtype.newbyteorder('='), copy=False)
+        if arr.ndim != 3:
+            raise ValueError(f'Expected a 3D image, got {arr.ndim}D: {path}')
+        # nibabel indexes voxels as IJK, slicer.util array helpers expect KJI
+        return np.ascontiguousarray(arr.transpose(2, 1, 0)), img.affine
+
+    def _volume_from_array(self, arr, affine, path, nodeClassName="vtkMRMLScalarVolumeNode"):
+        # NIfTI affines are already in RAS, so no LPS flip is needed here
+        name = os.path.basename(str(path)).split(".")[0]
+        return slicer.util.addVolumeFromArray(arr, ijkToRAS=slicer.util.vtkMatrixFromArray(affine), name=name, nodeClassName=nodeClassName)
+
+    def _load_nii_as_volume(self, path, arrays=None):
+        """Load a volume with nibabel, which is much faster than the ITK reader for .nii.gz files.
+        Uses the prefetched (array, affine) pair if given, falls back to slicer.util.loadVolume
+        for anything nibabel cannot read."""
+        try:
+            arr, affine = arrays if arrays is not None else self._read_nifti(path)
+        except Exception:
+            return slicer.util.loadVolume(path)
+        volume_node = self._volume_from_array(arr, affine, path)
+        slicer.util.setSliceViewerLayers(background=volume_node, fit=True)
+        return volume_node
+
+    def _load_nii_as_segmentation(self, path, arrays=None):
+        """Load a labelmap with nibabel and import it into a new segmentation node.
+        Uses the prefetched (array, affine) pair if given, falls back to slicer.util.loadSegmentation
+        for anything nibabel cannot read."""
+        try:
+            arr, affine = arrays if arrays is not None else self._read_nifti(path)
+        except Exception:
+            return slicer.util.loadSegmentation(path)
+        import numpy as np
+        if not np.issubdtype(arr.dtype, np.integer):
+            arr = np.rint(arr).astype(np.int32)
+        labelmap_node = self._volume_from_array(arr, affine, path, nodeClassName="vtkMRMLLabelMapVolumeNode")
+        segmentation_node = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLSegmentationNode", labelmap_node.GetName())
+        segmentation_node.CreateDefaultDisplayNodes()
+        # Every imported segment modifies the display node, update the views once for all of them
+        display_node = segmentation_node.GetDisplayNode()
+        wasModified = display_node.StartModify()
+        imported = slicer.modules.segmentations.logic().ImportLabelmapToSegmentationNode(labelmap_node, segmentation_node)
+        display_node.EndModify(wasModified)
+        slicer.mrmlScene.RemoveNode(labelmap_node)
+        if not imported:
+            # do not hand back an empty segmentation, let the regular loader read (or fail on) the file
+            slicer.mrmlScene.RemoveNode(segmentation_node)
+            return slicer.util.loadSegmentation(path)
+        return segmentation_node
+
     def set_segmentation_and_mask_for_segmentation_editor(self):
-        slicer.app.processEvents()
-        
-        # Set up segment editor widget
-        self.segmentEditorWidget.setMRMLScene(slicer.mrmlScene)
-        self.segmentEditorWidget.setMRMLSegmentEditorNode(slicer.mrmlScene.AddNewNodeByClass("vtkMRMLSegmentEditorNode"))
+        # Set up segment editor widget, reusing the singleton segment editor node
+        # instead of adding a new one to the scene for every case
+        if self.segmentEditorWidget.mrmlSegmentEditorNode() is not self.parameterSetNode:
+            self.selectParameterNode()
         self.segmentEditorWidget.setSegmentationNode(self.segmentation_node)
         self.segmentEditorWidget.setSourceVolumeNode(self.volume_node)
         
@@ -656,6 +795,7 @@ class SegmentationReviewWidget(ScriptedLoadableModuleWidget, VTKObservationMixin
         Called when the application closes and the module widget is destroyed.
         """
         self.removeObservers()
+        self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
         #self.effectFactorySingleton.disconnect("effectRegistered(QString)", self.editorEffectRegistered)
 
     def exit(self):